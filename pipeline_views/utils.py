@@ -1,6 +1,7 @@
 import asyncio
+import sys
 from contextlib import contextmanager
-from functools import wraps
+from functools import lru_cache, wraps
 from itertools import chain
 from typing import TYPE_CHECKING
 
@@ -10,11 +11,7 @@ from django.utils.translation import override
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.serializers import BaseSerializer
-
-try:
-    from pydantic import BaseModel
-except ImportError:
-    BaseModel = None
+from serializer_inference import serializer_from_callable
 
 from .typing import (
     Any,
@@ -40,6 +37,7 @@ __all__ = [
     "Sentinel",
     "get_language",
     "get_view_method",
+    "infer_serializer",
     "is_pydantic_model",
     "is_serializer_class",
     "run_parallel",
@@ -60,10 +58,28 @@ def is_serializer_class(obj: Any) -> TypeGuard[BaseSerializer]:
 
 
 def is_pydantic_model(obj: Any) -> bool:
-    if BaseModel is None:  # pragma: no cover
+    # Pydantic is optional, and not imported here to keep it out of startup time.
+    # If it hasn't been imported by anyone yet, 'obj' cannot be a pydantic model.
+    pydantic = sys.modules.get("pydantic")
+    if pydantic is None:  # pragma: no cover
         return False
 
-    return isinstance(obj, type) and issubclass(obj, BaseModel)
+    return isinstance(obj, type) and issubclass(obj, pydantic.BaseModel)
+
+
+def infer_serializer(logic: Union[LogicCallable, type[Any]], output: bool = False) -> SerializerType:
+    """
+    Infer a serializer from the logic callable's parameters, or its return type if `output=True`.
+    Inferred serializers are cached, since building them requires creating a new serializer class.
+    """
+    # Always call the cached function the same way, since 'lru_cache' keys
+    # positional and keyword arguments differently.
+    return _infer_serializer(logic, output)
+
+
+@lru_cache(maxsize=256)
+def _infer_serializer(logic: Union[LogicCallable, type[Any]], output: bool) -> SerializerType:
+    return serializer_from_callable(logic, output=output)
 
 
 def get_language(request: Request) -> str:
@@ -6,7 +6,6 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 from rest_framework.views import APIView
-from serializer_inference import serializer_from_callable
 
 from .exceptions import NextLogicBlock
 from .meta import PipelineMetadata
@@ -22,7 +21,15 @@ from .typing import (
     SerializerType,
     ViewContext,
 )
-from .utils import Sentinel, get_view_method, is_pydantic_model, is_serializer_class, run_parallel, translate
+from .utils import (
+    Sentinel,
+    get_view_method,
+    infer_serializer,
+    is_pydantic_model,
+    is_serializer_class,
+    run_parallel,
+    translate,
+)
 
 __all__ = [
     "BasePipelineView",
@@ -130,7 +137,11 @@ class BasePipelineView(APIView):
 
     def run_model(self, model_class: Any, data: DataDict) -> DataDict:
         """Build and validate a pydantic model"""
-        return model_class(**data).dict()
+        model = model_class(**data)
+        # Pydantic v2 deprecated '.dict()', and calling it goes through the warnings machinery.
+        if hasattr(model, "model_dump"):
+            return model.model_dump()
+        return model.dict()  # pragma: no cover
 
     def get_serializer(self, *args: Any, **kwargs: Any) -> Serializer:
         """Initialize serializer for current request HTTP method."""
@@ -167,10 +178,10 @@ class BasePipelineView(APIView):
             return step
 
         if is_pydantic_model(step):  # pragma: no cover
-            return serializer_from_callable(step)
+            return infer_serializer(step, output=False)
 
         if callable(step):
-            return serializer_from_callable(step, output=output)
+            return infer_serializer(step, output=output)
 
         msg = "Only Serializers and callables are supported in the pipeline."
         raise TypeError(msg)
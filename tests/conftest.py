@@ -1,4 +1,5 @@
 import os
+from typing import Callable
 
 import pytest
 from django.http import HttpRequest
@@ -32,3 +33,15 @@ def base_api_view(drf_request: Request) -> BasePipelineView:
     view.request = drf_request
     view.format_kwarg = None
     return view
+
+
+@pytest.fixture()
+def make_view(drf_request: Request) -> Callable[..., BasePipelineView]:
+    def factory(view_class: type[BasePipelineView], method: str) -> BasePipelineView:
+        view = view_class()
+        view.request = drf_request
+        view.format_kwarg = None
+        view.request.method = method
+        return view
+
+    return factory
@@ -1,8 +1,110 @@
+from typing import Any
+
 from rest_framework.test import APIClient, APIRequestFactory
 
 from tests.project.urls import ExampleView
 
 
+def schema_ref(name: str) -> dict[str, Any]:
+    return {"schema": {"$ref": f"#/components/schemas/{name}"}}
+
+
+INPUT_COMPONENT = {
+    "properties": {
+        "age": {
+            "type": "integer",
+        },
+        "name": {
+            "type": "string",
+        },
+    },
+    "required": [
+        "name",
+        "age",
+    ],
+    "type": "object",
+}
+
+OUTPUT_COMPONENT = {
+    "properties": {
+        "age": {
+            "type": "integer",
+        },
+        "email": {
+            "format": "email",
+            "type": "string",
+        },
+    },
+    "required": [
+        "email",
+        "age",
+    ],
+    "type": "object",
+}
+
+OUTPUT_RESPONSE = {
+    "content": {
+        "application/json": schema_ref("Output"),
+    },
+    "description": "Example Output",
+}
+
+UNAUTHENTICATED_RESPONSE = {
+    "content": {
+        "application/json": {
+            "schema": {
+                "properties": {
+                    "detail": {
+                        "default": "error message",
+                        "type": "string",
+                    },
+                },
+                "type": "object",
+            },
+        },
+    },
+    "description": "Unauthenticated.",
+}
+
+OPENAPI_SCHEMA = {
+    "components": {
+        "schemas": {
+            "Input": INPUT_COMPONENT,
+            "Output": OUTPUT_COMPONENT,
+        },
+    },
+    "info": {
+        "description": "API",
+        "title": "API",
+        "version": "",
+    },
+    "openapi": "3.0.2",
+    "paths": {
+        "/api/example/": {
+            "post": {
+                "description": "Example Input",
+                "operationId": "createInputExample",
+                "parameters": [],
+                "requestBody": {
+                    "content": {
+                        "application/json": schema_ref("Input"),
+                        "application/x-www-form-urlencoded": schema_ref("Input"),
+                        "multipart/form-data": schema_ref("Input"),
+                    },
+                },
+                "responses": {
+                    "200": OUTPUT_RESPONSE,
+                    "401": UNAUTHENTICATED_RESPONSE,
+                },
+                "tags": [
+                    "example",
+                ],
+            },
+        },
+    },
+}
+
+
 def test_example_endpoint__APIRequestFactory():
     factory = APIRequestFactory()
     view = ExampleView.as_view()
@@ -26,105 +128,4 @@ def test_openapi_endpoint():
 
     response = client.get("/openapi/")
 
-    assert response.data == {
-        "components": {
-            "schemas": {
-                "Input": {
-                    "properties": {
-                        "age": {
-                            "type": "integer",
-                        },
-                        "name": {
-                            "type": "string",
-                        },
-                    },
-                    "required": [
-                        "name",
-                        "age",
-                    ],
-                    "type": "object",
-                },
-                "Output": {
-                    "properties": {
-                        "age": {
-                            "type": "integer",
-                        },
-                        "email": {
-                            "format": "email",
-                            "type": "string",
-                        },
-                    },
-                    "required": [
-                        "email",
-                        "age",
-                    ],
-                    "type": "object",
-                },
-            },
-        },
-        "info": {
-            "description": "API",
-            "title": "API",
-            "version": "",
-        },
-        "openapi": "3.0.2",
-        "paths": {
-            "/api/example/": {
-                "post": {
-                    "description": "Example Input",
-                    "operationId": "createInputExample",
-                    "parameters": [],
-                    "requestBody": {
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "$ref": "#/components/schemas/Input",
-                                },
-                            },
-                            "application/x-www-form-urlencoded": {
-                                "schema": {
-                                    "$ref": "#/components/schemas/Input",
-                                },
-                            },
-                            "multipart/form-data": {
-                                "schema": {
-                                    "$ref": "#/components/schemas/Input",
-                                },
-                            },
-                        },
-                    },
-                    "responses": {
-                        "200": {
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Output",
-                                    },
-                                },
-                            },
-                            "description": "Example Output",
-                        },
-                        "401": {
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "properties": {
-                                            "detail": {
-                                                "default": "error message",
-                                                "type": "string",
-                                            },
-                                        },
-                                        "type": "object",
-                                    },
-                                },
-                            },
-                            "description": "Unauthenticated.",
-                        },
-                    },
-                    "tags": [
-                        "example",
-                    ],
-                },
-            },
-        },
-    }
+    assert response.data == OPENAPI_SCHEMA
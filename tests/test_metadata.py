@@ -1,10 +1,47 @@
+from typing import Any
+
+from openapi_schema.utils import deprecate
 from rest_framework import serializers
 
 from pipeline_views import BasePipelineView
 
 
-def test_metadata_class(drf_request):
-    class InputSerializer(serializers.Serializer):
+class InputSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    age = serializers.IntegerField()
+
+
+INPUT_ACTIONS = {
+    "name": {
+        "type": "string",
+        "required": True,
+    },
+    "age": {
+        "type": "integer",
+        "required": True,
+    },
+}
+
+
+def expected_metadata(actions: dict[str, Any], name: str = "Test") -> dict[str, Any]:
+    return {
+        "name": name,
+        "description": "This is the description",
+        "renders": [
+            "application/json",
+            "text/html",
+        ],
+        "parses": [
+            "application/json",
+            "application/x-www-form-urlencoded",
+            "multipart/form-data",
+        ],
+        "actions": actions,
+    }
+
+
+def test_metadata_class(make_view):
+    class HelpTextInputSerializer(serializers.Serializer):
         name = serializers.CharField(help_text="Help")
         age = serializers.IntegerField()
 
@@ -17,33 +54,17 @@ def test_metadata_class(drf_request):
 
         pipelines = {
             "GET": [
-                InputSerializer,
+                HelpTextInputSerializer,
                 OutputSerializer,
             ]
         }
 
-    drf_request.method = "GET"
-
-    view = TestView()
-    view.request = drf_request
-    view.format_kwarg = None
-    view.request.method = "GET"
+    view = make_view(TestView, "GET")
 
-    result = view.options(drf_request)
+    result = view.options(view.request)
 
-    assert result.data == {
-        "name": "Test",
-        "description": "This is the description",
-        "renders": [
-            "application/json",
-            "text/html",
-        ],
-        "parses": [
-            "application/json",
-            "application/x-www-form-urlencoded",
-            "multipart/form-data",
-        ],
-        "actions": {
+    assert result.data == expected_metadata(
+        actions={
             "GET": {
                 "input": {
                     "name": {
@@ -69,14 +90,10 @@ def test_metadata_class(drf_request):
                 },
             }
         },
-    }
-
+    )
 
-def test_metadata_class__output_list(drf_request):
-    class InputSerializer(serializers.Serializer):
-        name = serializers.CharField()
-        age = serializers.IntegerField()
 
+def test_metadata_class__output_list(make_view):
     class OutputSerializer(serializers.Serializer):
         many = True
 
@@ -93,39 +110,14 @@ def test_metadata_class__output_list(drf_request):
             ]
         }
 
-    drf_request.method = "GET"
+    view = make_view(TestView, "GET")
 
-    view = TestView()
-    view.request = drf_request
-    view.format_kwarg = None
-    view.request.method = "GET"
+    result = view.options(view.request)
 
-    result = view.options(drf_request)
-
-    assert result.data == {
-        "name": "Test",
-        "description": "This is the description",
-        "renders": [
-            "application/json",
-            "text/html",
-        ],
-        "parses": [
-            "application/json",
-            "application/x-www-form-urlencoded",
-            "multipart/form-data",
-        ],
-        "actions": {
+    assert result.data == expected_metadata(
+        actions={
             "GET": {
-                "input": {
-                    "name": {
-                        "type": "string",
-                        "required": True,
-                    },
-                    "age": {
-                        "type": "integer",
-                        "required": True,
-                    },
-                },
+                "input": INPUT_ACTIONS,
                 "output": [
                     {
                         "email": {
@@ -140,14 +132,10 @@ def test_metadata_class__output_list(drf_request):
                 ],
             }
         },
-    }
-
+    )
 
-def test_metadata_class__child_fields(drf_request):
-    class InputSerializer(serializers.Serializer):
-        name = serializers.CharField()
-        age = serializers.IntegerField()
 
+def test_metadata_class__child_fields(make_view):
     class OutputSerializer(serializers.Serializer):
         emails = serializers.ListField(child=serializers.EmailField())
         ages = serializers.DictField(child=serializers.IntegerField())
@@ -162,39 +150,14 @@ def test_metadata_class__child_fields(drf_request):
             ]
         }
 
-    drf_request.method = "GET"
+    view = make_view(TestView, "GET")
 
-    view = TestView()
-    view.request = drf_request
-    view.format_kwarg = None
-    view.request.method = "GET"
+    result = view.options(view.request)
 
-    result = view.options(drf_request)
-
-    assert result.data == {
-        "name": "Test",
-        "description": "This is the description",
-        "renders": [
-            "application/json",
-            "text/html",
-        ],
-        "parses": [
-            "application/json",
-            "application/x-www-form-urlencoded",
-            "multipart/form-data",
-        ],
-        "actions": {
+    assert result.data == expected_metadata(
+        actions={
             "GET": {
-                "input": {
-                    "name": {
-                        "type": "string",
-                        "required": True,
-                    },
-                    "age": {
-                        "type": "integer",
-                        "required": True,
-                    },
-                },
+                "input": INPUT_ACTIONS,
                 "output": {
                     "emails": [
                         {
@@ -211,14 +174,10 @@ def test_metadata_class__child_fields(drf_request):
                 },
             }
         },
-    }
-
+    )
 
-def test_metadata_class__serializer_field(drf_request):
-    class InputSerializer(serializers.Serializer):
-        name = serializers.CharField()
-        age = serializers.IntegerField()
 
+def test_metadata_class__serializer_field(make_view):
     class DataSerializer(serializers.Serializer):
         email = serializers.EmailField()
         age = serializers.IntegerField()
@@ -236,39 +195,14 @@ def test_metadata_class__serializer_field(drf_request):
             ]
         }
 
-    drf_request.method = "GET"
+    view = make_view(TestView, "GET")
 
-    view = TestView()
-    view.request = drf_request
-    view.format_kwarg = None
-    view.request.method = "GET"
+    result = view.options(view.request)
 
-    result = view.options(drf_request)
-
-    assert result.data == {
-        "name": "Test",
-        "description": "This is the description",
-        "renders": [
-            "application/json",
-            "text/html",
-        ],
-        "parses": [
-            "application/json",
-            "application/x-www-form-urlencoded",
-            "multipart/form-data",
-        ],
-        "actions": {
+    assert result.data == expected_metadata(
+        actions={
             "GET": {
-                "input": {
-                    "name": {
-                        "type": "string",
-                        "required": True,
-                    },
-                    "age": {
-                        "type": "integer",
-                        "required": True,
-                    },
-                },
+                "input": INPUT_ACTIONS,
                 "output": {
                     "data": {
                         "email": {
@@ -283,14 +217,10 @@ def test_metadata_class__serializer_field(drf_request):
                 },
             }
         },
-    }
+    )
 
 
-def test_metadata_class_choise_field(drf_request):
-    class InputSerializer(serializers.Serializer):
-        name = serializers.CharField()
-        age = serializers.IntegerField()
-
+def test_metadata_class_choise_field(make_view):
     class OutputSerializer(serializers.Serializer):
         items = serializers.ChoiceField(choices=["foo", "bar"])
 
@@ -304,39 +234,14 @@ def test_metadata_class_choise_field(drf_request):
             ]
         }
 
-    drf_request.method = "GET"
-
-    view = TestView()
-    view.request = drf_request
-    view.format_kwarg = None
-    view.request.method = "GET"
+    view = make_view(TestView, "GET")
 
-    result = view.options(drf_request)
+    result = view.options(view.request)
 
-    assert result.data == {
-        "name": "Test",
-        "description": "This is the description",
-        "renders": [
-            "application/json",
-            "text/html",
-        ],
-        "parses": [
-            "application/json",
-            "application/x-www-form-urlencoded",
-            "multipart/form-data",
-        ],
-        "actions": {
+    assert result.data == expected_metadata(
+        actions={
             "GET": {
-                "input": {
-                    "name": {
-                        "type": "string",
-                        "required": True,
-                    },
-                    "age": {
-                        "type": "integer",
-                        "required": True,
-                    },
-                },
+                "input": INPUT_ACTIONS,
                 "output": {
                     "items": {
                         "type": "choice",
@@ -346,4 +251,54 @@ def test_metadata_class_choise_field(drf_request):
                 },
             }
         },
-    }
+    )
+
+
+def test_metadata_class__request_method_differs_from_pipeline_method(make_view):
+    class TestView(BasePipelineView):
+        """This is the description"""
+
+        pipelines = {
+            "POST": [
+                InputSerializer,
+            ]
+        }
+
+    view = make_view(TestView, "OPTIONS")
+
+    result = view.options(view.request)
+
+    assert result.data == expected_metadata(
+        actions={
+            "POST": {
+                "input": INPUT_ACTIONS,
+                "output": INPUT_ACTIONS,
+            }
+        },
+    )
+    assert view.request.method == "OPTIONS"
+
+
+def test_metadata_class__deprecated_view(make_view):
+    class TestView(BasePipelineView):
+        """This is the description"""
+
+        pipelines = {
+            "POST": [
+                InputSerializer,
+            ]
+        }
+
+    view = make_view(deprecate(TestView), "OPTIONS")
+
+    result = view.options(view.request)
+
+    assert result.data == expected_metadata(
+        actions={
+            "POST": {
+                "input": INPUT_ACTIONS,
+                "output": INPUT_ACTIONS,
+            }
+        },
+        name="Deprecated Test",
+    )
@@ -1,10 +1,11 @@
 import pytest
 from django.http import HttpRequest
 from django.utils.translation import get_language as which_language
+from pydantic import BaseModel
 from rest_framework.request import Request
 
 from pipeline_views import BasePipelineView
-from pipeline_views.utils import get_language, translate
+from pipeline_views.utils import get_language, infer_serializer, is_pydantic_model, translate
 
 
 def test_get_language__from_language_code(drf_request):
@@ -65,7 +66,7 @@ def test_translate__as_context_manager(drf_request):
         assert str(which_language()) == "fi"
 
 
-def test_get_view_method__get(drf_request):
+def test_get_view_method__get(drf_request, make_view):
     data = None
 
     def caller(**kwargs):
@@ -77,16 +78,14 @@ def test_get_view_method__get(drf_request):
 
     drf_request._request.GET[b"key"] = b"value"
 
-    view = TestView()
-    view.request = drf_request
-    view.format_kwarg = None
-    view.request.method = "GET"
+    view = make_view(TestView, "GET")
     view.get(drf_request)
 
     assert data == {"key": "value"}
 
 
-def test_get_view_method__post(drf_request):
+@pytest.mark.parametrize("method", ["POST", "PUT", "PATCH", "DELETE"])
+def test_get_view_method__from_data(drf_request, make_view, method):
     data = None
 
     def caller(**kwargs):
@@ -94,77 +93,32 @@ def test_get_view_method__post(drf_request):
         data = kwargs
 
     class TestView(BasePipelineView):
-        pipelines = {"POST": [caller]}
+        pipelines = {method: [caller]}
 
     drf_request._data = drf_request._full_data = {"key": "value"}
 
-    view = TestView()
-    view.request = drf_request
-    view.format_kwarg = None
-    view.request.method = "POST"
-    view.post(drf_request)
+    view = make_view(TestView, method)
+    getattr(view, method.lower())(drf_request)
 
     assert data == {"key": "value"}
 
 
-def test_get_view_method__put(drf_request):
-    data = None
-
-    def caller(**kwargs):
-        nonlocal data
-        data = kwargs
-
-    class TestView(BasePipelineView):
-        pipelines = {"PUT": [caller]}
-
-    drf_request._data = drf_request._full_data = {"key": "value"}
+def test_infer_serializer__cached():
+    def callable_method(name: str, age: int) -> dict[str, int]:
+        pass
 
-    view = TestView()
-    view.request = drf_request
-    view.format_kwarg = None
-    view.request.method = "PUT"
-    view.put(drf_request)
+    serializer_class = infer_serializer(callable_method)
 
-    assert data == {"key": "value"}
+    assert infer_serializer(callable_method) is serializer_class
+    assert infer_serializer(callable_method, False) is serializer_class
+    assert infer_serializer(callable_method, output=False) is serializer_class
+    assert infer_serializer(callable_method, output=True) is not serializer_class
 
 
-def test_get_view_method__patch(drf_request):
-    data = None
+def test_is_pydantic_model():
+    class InputModel(BaseModel):
+        name: str
 
-    def caller(**kwargs):
-        nonlocal data
-        data = kwargs
-
-    class TestView(BasePipelineView):
-        pipelines = {"PATCH": [caller]}
-
-    drf_request._data = drf_request._full_data = {"key": "value"}
-
-    view = TestView()
-    view.request = drf_request
-    view.format_kwarg = None
-    view.request.method = "PATCH"
-    view.patch(drf_request)
-
-    assert data == {"key": "value"}
-
-
-def test_get_view_method__delete(drf_request):
-    data = None
-
-    def caller(**kwargs):
-        nonlocal data
-        data = kwargs
-
-    class TestView(BasePipelineView):
-        pipelines = {"DELETE": [caller]}
-
-    drf_request._data = drf_request._full_data = {"key": "value"}
-
-    view = TestView()
-    view.request = drf_request
-    view.format_kwarg = None
-    view.request.method = "DELETE"
-    view.delete(drf_request)
-
-    assert data == {"key": "value"}
+    assert is_pydantic_model(InputModel) is True
+    assert is_pydantic_model(InputModel(name="foo")) is False
+    assert is_pydantic_model(dict) is False
@@ -1,13 +1,30 @@
 import pytest
 from django.utils.translation import get_language
+from openapi_schema.utils import deprecate
 from pydantic import BaseModel
 from rest_framework.fields import CharField, IntegerField
 from rest_framework.serializers import Serializer
+from rest_framework.test import APIRequestFactory
 
+from pipeline_views import BasePipelineView
 from pipeline_views.exceptions import NextLogicBlock
 from pipeline_views.typing import TypedDict
 
 
+class InputSerializer(Serializer):
+    name = CharField()
+    age = IntegerField()
+
+
+class OutputSerializer(Serializer):
+    full_name = CharField()
+    age = IntegerField()
+
+
+class OtherOutputSerializer(Serializer):
+    other = CharField()
+
+
 def test_BaseAPIView__one_logic_callable(base_api_view):
     def callable_method(testing: int):
         return {"testing": testing * 2}
@@ -114,6 +131,35 @@ def test_BaseAPIView__get_pipeline(base_api_view):
     assert pipeline == base_api_view.pipelines["GET"]
 
 
+def test_BaseAPIView__method_handlers_added_for_pipelines_set_after_class_creation():
+    def callable_method(testing: str):
+        return {"testing": testing}
+
+    class TestView(BasePipelineView):
+        pipelines = {"POST": [callable_method]}
+
+    view = TestView.as_view()
+    TestView.pipelines = {"POST": [callable_method], "GET": [callable_method]}
+
+    request = APIRequestFactory().get("/", {"testing": "foo"})
+    response = view(request)
+
+    assert response.status_code == 200
+    assert response.data == {"testing": "foo"}
+
+
+def test_BaseAPIView__method_handlers_added_on_instantiation():
+    def callable_method(testing: str):
+        return {"testing": testing}
+
+    class TestView(BasePipelineView):
+        pipelines = {"POST": [callable_method]}
+
+    TestView.pipelines = {"POST": [callable_method], "GET": [callable_method]}
+
+    assert hasattr(TestView(), "get")
+
+
 def test_BaseAPIView__get_pipeline__no_pipeline_defined(base_api_view):
     base_api_view.request.method = "GET"
 
@@ -246,10 +292,6 @@ def test_BaseAPIView__return_204(base_api_view):
 
 
 def test_BaseAPIView__one_serializer(base_api_view):
-    class InputSerializer(Serializer):
-        name = CharField()
-        age = IntegerField()
-
     base_api_view.request.method = "GET"
     base_api_view.pipelines = {"GET": [InputSerializer]}
 
@@ -274,10 +316,6 @@ def test_BaseAPIView__one_serializer__data_is_none(base_api_view):
 
 
 def test_BaseAPIView__one_serializer__inside_logic_block(base_api_view):
-    class InputSerializer(Serializer):
-        name = CharField()
-        age = IntegerField()
-
     base_api_view.request.method = "GET"
     base_api_view.pipelines = {"GET": [[InputSerializer]]}
 
@@ -288,17 +326,9 @@ def test_BaseAPIView__one_serializer__inside_logic_block(base_api_view):
 
 
 def test_BaseAPIView__two_serializers_one_logic_callable(base_api_view):
-    class InputSerializer(Serializer):
-        name = CharField()
-        age = IntegerField()
-
     def callable_method1(name: str, age: int):
         return {"full_name": f"{name} Doe", "age": age}
 
-    class OutputSerializer(Serializer):
-        full_name = CharField()
-        age = IntegerField()
-
     base_api_view.request.method = "GET"
     base_api_view.pipelines = {"GET": [InputSerializer, callable_method1, OutputSerializer]}
 
@@ -309,17 +339,9 @@ def test_BaseAPIView__two_serializers_one_logic_callable(base_api_view):
 
 
 def test_BaseAPIView__two_serializers_one_logic_callable__inside_logic_block(base_api_view):
-    class InputSerializer(Serializer):
-        name = CharField()
-        age = IntegerField()
-
     def callable_method1(name: str, age: int):
         return {"full_name": f"{name} Doe", "age": age}
 
-    class OutputSerializer(Serializer):
-        full_name = CharField()
-        age = IntegerField()
-
     base_api_view.request.method = "GET"
     base_api_view.pipelines = {"GET": [[InputSerializer, callable_method1, OutputSerializer]]}
 
@@ -330,10 +352,6 @@ def test_BaseAPIView__two_serializers_one_logic_callable__inside_logic_block(bas
 
 
 def test_BaseAPIView__two_serializers_one_logic_callable__output_serializer_is_list_serializer(base_api_view):
-    class InputSerializer(Serializer):
-        name = CharField()
-        age = IntegerField()
-
     def callable_method1(name: str, age: int):
         return [{"full_name": f"{name} Doe", "age": age}, {"full_name": f"{name} Doe", "age": age}]
 
@@ -373,10 +391,6 @@ def test_BaseAPIView__pyantic_models(base_api_view):
 
 
 def test_BaseAPIView__get_serializer(base_api_view):
-    class InputSerializer(Serializer):
-        name = CharField()
-        age = IntegerField()
-
     base_api_view.request.method = "GET"
     base_api_view.pipelines = {"GET": [InputSerializer]}
 
@@ -390,6 +404,17 @@ def test_BaseAPIView__get_serializer(base_api_view):
     }
 
 
+def test_BaseAPIView__get_serializer__deprecated_view(make_view):
+    class TestView(BasePipelineView):
+        pipelines = {"POST": [InputSerializer]}
+
+    view = make_view(deprecate(TestView), "POST")
+
+    serializer = view.get_serializer()
+
+    assert type(serializer).__name__ == "DeprecatedInputSerializer"
+
+
 def test_BaseAPIView__get_serializer__not_a_serializer(base_api_view):
     base_api_view.request.method = "GET"
     base_api_view.pipelines = {"GET": [1, 2, 3]}
@@ -462,17 +487,9 @@ def test_BaseAPIView__get_serializer__infer_from_logic_callable__typeddict(base_
 
 
 def test_BaseAPIView__get_serializer__output_serializer(base_api_view):
-    class InputSerializer(Serializer):
-        name = CharField()
-        age = IntegerField()
-
     def callable_method1(name: str, age: int):
         return {"full_name": f"{name} Doe", "age": age}
 
-    class OutputSerializer(Serializer):
-        full_name = CharField()
-        age = IntegerField()
-
     base_api_view.request.method = "GET"
     base_api_view.pipelines = {"GET": [InputSerializer, callable_method1, OutputSerializer]}
 
@@ -517,28 +534,17 @@ def test_BaseAPIView__get_serializer__output_serializer__infer_from_logic_callab
 
 
 def test_BaseAPIView__get_serializer__output_serializer__logic_block_at_the_end(base_api_view):
-    class InputSerializer(Serializer):
-        name = CharField()
-        age = IntegerField()
-
     def callable_method1(name: str, age: int):
         return {"full_name": f"{name} Doe", "age": age}
 
-    class OutputSerializer1(Serializer):
-        full_name = CharField()
-        age = IntegerField()
-
-    class OutputSerializer2(Serializer):
-        other = CharField()
-
     base_api_view.request.method = "GET"
     base_api_view.pipelines = {
         "GET": [
             InputSerializer,
             callable_method1,
             [
-                OutputSerializer1,
-                OutputSerializer2,
+                OutputSerializer,
+                OtherOutputSerializer,
             ],
         ]
     }
@@ -554,28 +560,17 @@ def test_BaseAPIView__get_serializer__output_serializer__logic_block_at_the_end(
 
 
 def test_BaseAPIView__get_serializer__output_serializer__conditional_block_at_the_end(base_api_view):
-    class InputSerializer(Serializer):
-        name = CharField()
-        age = IntegerField()
-
     def callable_method1(name: str, age: int):
         return {"full_name": f"{name} Doe", "age": age}
 
-    class OutputSerializer1(Serializer):
-        full_name = CharField()
-        age = IntegerField()
-
-    class OutputSerializer2(Serializer):
-        other = CharField()
-
     base_api_view.request.method = "GET"
     base_api_view.pipelines = {
         "GET": [
             InputSerializer,
             callable_method1,
             {
-                "1": OutputSerializer1,
-                "2": OutputSerializer2,
+                "1": OutputSerializer,
+                "2": OtherOutputSerializer,
             },
         ]
     }
@@ -591,28 +586,17 @@ def test_BaseAPIView__get_serializer__output_serializer__conditional_block_at_th
 
 
 def test_BaseAPIView__get_serializer__output_serializer__parallel_block_at_the_end(base_api_view):
-    class InputSerializer(Serializer):
-        name = CharField()
-        age = IntegerField()
-
     def callable_method1(name: str, age: int):
         return {"full_name": f"{name} Doe", "age": age}
 
-    class OutputSerializer1(Serializer):
-        full_name = CharField()
-        age = IntegerField()
-
-    class OutputSerializer2(Serializer):
-        other = CharField()
-
     base_api_view.request.method = "GET"
     base_api_view.pipelines = {
         "GET": [
             InputSerializer,
             callable_method1,
             (
-                OutputSerializer1,
-                OutputSerializer2,
+                OutputSerializer,
+                OtherOutputSerializer,
             ),
         ]
     }
@@ -721,31 +705,18 @@ def test_BaseAPIView__conditional__next_step_is_not_conditional_path(base_api_vi
         base_api_view.process_request(data={"param": 10})
 
 
-def test_BaseAPIView__translated_en(base_api_view):
-    def callable_method():
-        return {"lang": str(get_language())}
-
-    base_api_view.request.method = "GET"
-    base_api_view.request.LANGUAGE_CODE = "en"
-    base_api_view.pipelines = {"GET": [callable_method]}
-
-    response = base_api_view.process_request(data={})
-
-    assert response.data == {"lang": "en"}
-    assert response.status_code == 200
-
-
-def test_BaseAPIView__translated_fi(base_api_view):
+@pytest.mark.parametrize("language", ["en", "fi"])
+def test_BaseAPIView__translated(base_api_view, language: str):
     def callable_method():
         return {"lang": str(get_language())}
 
     base_api_view.request.method = "GET"
-    base_api_view.request.LANGUAGE_CODE = "fi"
+    base_api_view.request.LANGUAGE_CODE = language
     base_api_view.pipelines = {"GET": [callable_method]}
 
     response = base_api_view.process_request(data={})
 
-    assert response.data == {"lang": "fi"}
+    assert response.data == {"lang": language}
     assert response.status_code == 200
 
 